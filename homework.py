@@ -1,13 +1,19 @@
 import logging
 import os
+import sys
 import time
 from http import HTTPStatus
+from types import MappingProxyType
 from typing import Any, Dict, List, Mapping, Optional
 
+import orjson
 import requests
 from dotenv import load_dotenv
 from requests import Response
+from requests.adapters import HTTPAdapter
 from telegram import Bot
+from telegram.utils.request import Request
+from urllib3.util.retry import Retry
 
 from exceptions import EndpointUnavailableError
 
@@ -15,24 +21,51 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
-stream_handler = logging.StreamHandler()
-logger.addHandler(stream_handler)
-
 
 PRACTICUM_TOKEN = os.getenv('PRACTICUM_TOKEN')
 TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 
 RETRY_TIME = 600
+MAX_RETRY_TIME = 3600
+ERROR_RETRY_TIME = 5
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
-HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
-
+HEADERS = MappingProxyType({'Authorization': f'OAuth {PRACTICUM_TOKEN}'})
+
+# Одна сессия на весь процесс: соединение с апи переиспользуется между
+# опросами, и TLS-рукопожатие выполняется только один раз.
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=1.0,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    ),
+))
+REQUEST_TIMEOUT = (5, 30)
+
+
+TELEGRAM_MESSAGE_LIMIT = 4096
+MESSAGE_SEPARATOR = '\n\n'
 
 HOMEWORK_STATUSES = {
     'approved': 'Работа проверена: ревьюеру всё понравилось. Ура!',
     'reviewing': 'Работа взята на проверку ревьюером.',
     'rejected': 'Работа проверена: у ревьюера есть замечания.',
 }
+STATUS_MESSAGE_TEMPLATE = 'Изменился статус проверки работы "%s". %s'
+
+SEND_ERROR_TEMPLATE = 'При отправке сообщения произошла ошибка {}'
+REQUEST_ERROR_TEMPLATE = 'Ошибка при попытке доступа к апи: {}'
+API_UNAVAILABLE_TEMPLATE = 'Эндпоинт недоступен. Статус ошибки: {}'
+UNEXPECTED_HOMEWORK_TEMPLATE = (
+    'Неожиданные входные данные: название: {}, статус: {}')
+MAIN_ERROR_TEMPLATE = 'Сбой в работе программы: {}'
+MALFORMED_HOMEWORK_TEMPLATE = 'Не удалось разобрать статус домашней работы. {}'
 
 
 def send_message(bot: Bot, message: str):
@@ -41,72 +74,128 @@ def send_message(bot: Bot, message: str):
         bot.send_message(
             chat_id=TELEGRAM_CHAT_ID,
             text=message,
+            disable_web_page_preview=True,
         )
-        logging.info('Сообщение отправлено успешно!')
+        logger.info('Сообщение отправлено успешно!')
     except Exception as e:
-        logging.exception(f'При отправке сообщения произошла ошибка {e}')
+        logger.exception(SEND_ERROR_TEMPLATE.format(e))
 
 
 def get_api_answer(current_timestamp: int) -> Dict:
     """Делает запрос к апи домашек яндекс практикума."""
-    timestamp: int = current_timestamp or int(time.time())
-    params = {'from_date': timestamp}
+    params = {'from_date': current_timestamp}
     try:
-        homeworks_response: Response = requests.get(
-            ENDPOINT, headers=HEADERS, params=params)
+        homeworks_response: Response = SESSION.get(
+            ENDPOINT,
+            headers=HEADERS,
+            params=params,
+            timeout=REQUEST_TIMEOUT,
+        )
     except Exception as e:
-        message_request_error = f'Ошибка при попытке доступа к апи: {e}'
-        logging.error(message_request_error)
+        message_request_error = REQUEST_ERROR_TEMPLATE.format(e)
+        logger.error(message_request_error)
         raise Exception(message_request_error) from e
 
     if homeworks_response.status_code != HTTPStatus.OK:
-        error_message_api_unavailable = (
-            f'Эндпоинт недоступен.'
-            f'Статус ошибки: {homeworks_response.status_code}')
-        logging.error(error_message_api_unavailable)
+        error_message_api_unavailable = API_UNAVAILABLE_TEMPLATE.format(
+            homeworks_response.status_code)
+        logger.error(error_message_api_unavailable)
         raise EndpointUnavailableError(error_message_api_unavailable)
-    return homeworks_response.json()
+    return orjson.loads(homeworks_response.content)
 
 
 def check_response(response: Dict) -> List[Mapping]:
     """Проверяет правильность ответа апи."""
-    if not isinstance(response, dict):
-        error_message_dict = 'Ответ апи пришел не в виде словаря.'
-        logging.error(error_message_dict)
-        raise TypeError(error_message_dict)
-
-    homeworks_list: List[Mapping] = response.get('homeworks')
-
-    if not isinstance(homeworks_list, list):
+    try:
+        homeworks: List[Mapping] = response['homeworks']
+    except (TypeError, KeyError) as e:
+        error_message_dict = (
+            'Ответ апи пришел не в виде словаря с ключом homeworks.')
+        logger.error(error_message_dict)
+        raise TypeError(error_message_dict) from e
+
+    if type(homeworks) is not list:
         error_message_list = 'Под ключом homeworks находится не список.'
-        logging.error(error_message_list)
+        logger.error(error_message_list)
         raise TypeError(error_message_list)
 
-    return homeworks_list
+    return homeworks
 
 
 def parse_status(homework: Mapping[str, Any]) -> str:
     """Получает статус домашки и формирует сообщение для отправки."""
     homework_name: Optional[str] = homework.get('homework_name')
     homework_status: Optional[str] = homework.get('status')
+    verdict: Optional[str] = HOMEWORK_STATUSES.get(homework_status)
 
-    if not homework_name or homework_status not in HOMEWORK_STATUSES.keys():
-        error_message = (
-            f'Неожиданные входные данные: '
-            f'название: {homework_name}, статус: {homework_status}')
-        logging.error(error_message)
+    if not homework_name or verdict is None:
+        error_message = UNEXPECTED_HOMEWORK_TEMPLATE.format(
+            homework_name, homework_status)
+        logger.error(error_message)
         raise KeyError(error_message)
 
-    verdict: str = HOMEWORK_STATUSES[homework_status]
-    return f'Изменился статус проверки работы "{homework_name}". {verdict}'
+    return STATUS_MESSAGE_TEMPLATE % (homework_name, verdict)
+
+
+def build_messages(homeworks: List[Mapping[str, Any]]) -> List[str]:
+    """Формирует сообщения по всем домашкам из ответа апи.
+
+    Домашка с неожиданными данными не мешает отправке остальных:
+    вместо её статуса в пачку попадает сообщение об ошибке.
+    """
+    messages: List[str] = []
+    for homework in homeworks:
+        try:
+            messages.append(parse_status(homework))
+        except KeyError as error:
+            messages.append(MALFORMED_HOMEWORK_TEMPLATE.format(error.args[0]))
+    return messages
+
+
+def split_messages(messages: List[str]) -> List[str]:
+    """Склеивает сообщения в части, укладывающиеся в лимит телеграма."""
+    chunks: List[str] = []
+    current: str = ''
+    for message in messages:
+        candidate = (
+            f'{current}{MESSAGE_SEPARATOR}{message}' if current else message)
+        if len(candidate) <= TELEGRAM_MESSAGE_LIMIT:
+            current = candidate
+            continue
+        if current:
+            chunks.append(current)
+        current = message
+        while len(current) > TELEGRAM_MESSAGE_LIMIT:
+            chunks.append(current[:TELEGRAM_MESSAGE_LIMIT])
+            current = current[TELEGRAM_MESSAGE_LIMIT:]
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def sleep_from(started_ns: int, interval: int):
+    """Спит до момента started_ns + interval секунд по монотонным часам."""
+    remaining_ns = started_ns + interval * 1_000_000_000 - time.monotonic_ns()
+    if remaining_ns > 0:
+        time.sleep(remaining_ns / 1_000_000_000)
+
+
+def error_key(error: Exception) -> str:
+    """Возвращает устойчивый ключ ошибки для подавления повторов.
+
+    Текст сетевых ошибок меняется от попытки к попытке (в нём есть адрес
+    объекта соединения), поэтому обёрнутые ошибки сравниваются по типам.
+    """
+    cause: Optional[BaseException] = error.__cause__
+    if cause is not None:
+        return f'{type(error).__name__}:{type(cause).__name__}'
+    return f'{type(error).__name__}:{error}'
 
 
 def check_tokens() -> bool:
     """Проверяет что все нужные переменные окружения доступны."""
-    if not (PRACTICUM_TOKEN
-            and TELEGRAM_TOKEN
-            and TELEGRAM_CHAT_ID):
-        logging.critical(
+    if not all((PRACTICUM_TOKEN, TELEGRAM_TOKEN, TELEGRAM_CHAT_ID)):
+        logger.critical(
             'Отсутствуют обязательные переменные окружения!')
         return False
     return True
@@ -115,28 +204,45 @@ def check_tokens() -> bool:
 def main():
     """Основная логика работы бота."""
     if not check_tokens():
-        return
+        sys.exit('Работа бота остановлена: не заданы токены.')
 
-    bot: Bot = Bot(token=TELEGRAM_TOKEN)
-    current_timestamp: int = int(time.time())
+    bot: Bot = Bot(
+        token=TELEGRAM_TOKEN,
+        request=Request(con_pool_size=8, connect_timeout=5, read_timeout=20),
+    )
+    current_timestamp: int = time.time_ns() // 1_000_000_000
+    retry_time: int = RETRY_TIME
+    consecutive_errors: int = 0
+    last_error_key: Optional[str] = None
 
     while True:
+        poll_started_ns: int = time.monotonic_ns()
         try:
             homeworks_data = get_api_answer(current_timestamp)
 
             homeworks = check_response(homeworks_data)
             if homeworks:
-                for homework in homeworks:
-                    send_message(bot, parse_status(homework))
+                for chunk in split_messages(build_messages(homeworks)):
+                    send_message(bot, chunk)
+                retry_time = RETRY_TIME
             else:
-                logging.debug('Нет новых изменений статуса домашних работ.')
-            current_timestamp = int(time.time())
-            time.sleep(RETRY_TIME)
+                logger.debug('Нет новых изменений статуса домашних работ.')
+            current_timestamp = (
+                homeworks_data.get('current_date') or current_timestamp)
+            consecutive_errors = 0
+            last_error_key = None
+            sleep_from(poll_started_ns, retry_time)
+            if not homeworks:
+                retry_time = min(retry_time * 2, MAX_RETRY_TIME)
         except Exception as error:
-            message = f'Сбой в работе программы: {error}'
-            logging.exception(message)
-            send_message(bot, message)
-            time.sleep(RETRY_TIME)
+            message = MAIN_ERROR_TEMPLATE.format(error)
+            logger.exception(message)
+            if error_key(error) != last_error_key:
+                send_message(bot, message)
+                last_error_key = error_key(error)
+            consecutive_errors += 1
+            time.sleep(min(
+                RETRY_TIME, 2 ** consecutive_errors * ERROR_RETRY_TIME))
 
 
 if __name__ == '__main__':
@@ -1,3 +1,4 @@
+import json
 import os
 from http import HTTPStatus
 
@@ -45,6 +46,10 @@ class MockResponseGET:
         self.random_timestamp = random_timestamp
         self.status_code = http_status
 
+    @property
+    def content(self):
+        return json.dumps(self.json()).encode()
+
     def json(self):
         data = {
             "homeworks": [],
@@ -150,6 +155,30 @@ class TestHomework:
             f'функция {func_name} возвращает True'
         )
 
+    def test_main_exits_without_tokens(self, monkeypatch):
+        bots = []
+
+        def mock_telegram_bot(*args, **kwargs):
+            bots.append(kwargs)
+            return MockTelegramBot(*args, **kwargs)
+
+        import homework
+
+        monkeypatch.setattr(homework, 'PRACTICUM_TOKEN', None)
+        monkeypatch.setattr(homework, 'Bot', mock_telegram_bot)
+        try:
+            homework.main()
+        except SystemExit:
+            pass
+        else:
+            assert False, (
+                'Убедитесь, что при отсутствии переменных окружения '
+                'бот завершает работу через `SystemExit`'
+            )
+        assert not bots, (
+            'Убедитесь, что бот не создаётся при отсутствии токенов'
+        )
+
     def test_bot_init_not_global(self):
         import homework
 
@@ -178,6 +207,24 @@ class TestHomework:
         import homework
         utils.check_function(homework, 'send_message', 2)
 
+    def test_send_message_uses_bot(self, monkeypatch, random_timestamp):
+        sent = []
+
+        class RecordingBot(MockTelegramBot):
+            def send_message(self, chat_id=None, text=None, **kwargs):
+                sent.append((chat_id, text))
+                return super().send_message(chat_id, text, **kwargs)
+
+        import homework
+
+        monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', '@channel')
+        bot = RecordingBot(token='1234:abcdefg')
+        homework.send_message(bot, 'text')
+        assert sent == [('@channel', 'text')], (
+            'Проверьте, что функция `send_message` отправляет сообщение '
+            'методом бота в чат TELEGRAM_CHAT_ID'
+        )
+
     def test_get_api_answers(self, monkeypatch, random_timestamp,
                              current_timestamp, api_url):
         def mock_response_get(*args, **kwargs):
@@ -186,10 +233,10 @@ class TestHomework:
                 current_timestamp=current_timestamp, **kwargs
             )
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_response_get)
+
         func_name = 'get_api_answer'
         utils.check_function(homework, func_name, 1)
 
@@ -232,10 +279,10 @@ class TestHomework:
             response.json = json_invalid
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_500_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_500_response_get)
+
         func_name = 'get_api_answer'
         try:
             homework.get_api_answer(current_timestamp)
@@ -315,10 +362,10 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_response_get)
+
         func_name = 'check_response'
         response = homework.get_api_answer(current_timestamp)
         status = homework.check_response(response)
@@ -352,10 +399,10 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_response_get)
+
         func_name = 'parse_status'
         response = homework.get_api_answer(current_timestamp)
         homeworks = homework.check_response(response)
@@ -400,10 +447,10 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_response_get)
+
         func_name = 'parse_status'
         response = homework.get_api_answer(current_timestamp)
         homeworks = homework.check_response(response)
@@ -448,10 +495,10 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_response_get)
+
         func_name = 'parse_status'
         response = homework.get_api_answer(current_timestamp)
         homeworks = homework.check_response(response)
@@ -484,10 +531,10 @@ class TestHomework:
             response.json = json_invalid
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_no_homeworks_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_no_homeworks_response_get)
+
         func_name = 'check_response'
         result = homework.get_api_answer(current_timestamp)
         try:
@@ -525,10 +572,10 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_response_get)
+
         func_name = 'check_response'
         response = homework.get_api_answer(current_timestamp)
         try:
@@ -565,10 +612,10 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_response_get)
+
         func_name = 'check_response'
         response = homework.get_api_answer(current_timestamp)
         try:
@@ -599,10 +646,10 @@ class TestHomework:
             response.json = json_invalid
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_empty_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_empty_response_get)
+
         func_name = 'check_response'
         result = homework.get_api_answer(current_timestamp)
         try:
@@ -626,10 +673,10 @@ class TestHomework:
             )
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_response_get)
+
         func_name = 'check_response'
         try:
             homework.get_api_answer(current_timestamp)
@@ -640,3 +687,203 @@ class TestHomework:
                 f'Убедитесь, что в функции `{func_name}` обрабатываете ситуацию, '
                 'когда API возвращает код, отличный от 200'
             )
+
+    def test_build_messages_skips_invalid_homework(self):
+        import homework
+
+        messages = homework.build_messages([
+            {'homework_name': 'hw1', 'status': 'approved'},
+            {'homework_name': 'hw2', 'status': 'unknown'},
+            {'homework_name': 'hw3', 'status': 'rejected'},
+        ])
+        assert len(messages) == 3, (
+            'Проверьте, что домашка с неожиданным статусом '
+            'не мешает сформировать сообщения по остальным'
+        )
+        assert messages[0].endswith(self.HOMEWORK_STATUSES['approved'])
+        assert messages[1] == (
+            'Не удалось разобрать статус домашней работы. '
+            'Неожиданные входные данные: название: hw2, статус: unknown'
+        ), (
+            'Проверьте, что для домашки с неожиданным статусом '
+            'в пачку попадает понятное сообщение без кавычек repr'
+        )
+        assert messages[2].endswith(self.HOMEWORK_STATUSES['rejected'])
+
+    def test_split_messages_under_limit(self):
+        import homework
+
+        chunks = homework.split_messages(['first', 'second', 'third'])
+        assert chunks == ['first\n\nsecond\n\nthird'], (
+            'Проверьте, что сообщения, укладывающиеся в лимит, '
+            'отправляются одним сообщением в исходном порядке'
+        )
+
+    def test_split_messages_spans_messages(self):
+        import homework
+
+        limit = homework.TELEGRAM_MESSAGE_LIMIT
+        messages = ['a' * 3000, 'b' * 3000, 'c' * 10]
+        chunks = homework.split_messages(messages)
+        assert chunks == ['a' * 3000, 'b' * 3000 + '\n\n' + 'c' * 10], (
+            'Проверьте, что сообщения разбиваются по границам '
+            'и сохраняют порядок'
+        )
+        assert all(len(chunk) <= limit for chunk in chunks)
+
+    def test_split_messages_long_message(self):
+        import homework
+
+        limit = homework.TELEGRAM_MESSAGE_LIMIT
+        message = 'x' * (limit * 2 + 100)
+        chunks = homework.split_messages(['short', message])
+        assert chunks[0] == 'short'
+        assert [len(chunk) for chunk in chunks[1:]] == [limit, limit, 100], (
+            'Проверьте, что слишком длинное сообщение режется '
+            'на части не длиннее лимита телеграма'
+        )
+        assert ''.join(chunks[1:]) == message
+
+    def test_main_sends_repeated_error_once(self, monkeypatch):
+        class StopPolling(Exception):
+            pass
+
+        sent = []
+        sleeps = []
+
+        class RecordingBot(MockTelegramBot):
+            def send_message(self, chat_id=None, text=None, **kwargs):
+                sent.append(text)
+                return super().send_message(chat_id, text, **kwargs)
+
+        def mock_connection_error_get(*args, **kwargs):
+            raise requests.ConnectionError(
+                f'Failed to establish a new connection: {object()}')
+
+        def mock_sleep(interval):
+            sleeps.append(interval)
+            if len(sleeps) == 2:
+                raise StopPolling
+
+        import homework
+
+        monkeypatch.setattr(homework, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', '12345')
+        monkeypatch.setattr(homework, 'Bot', RecordingBot)
+        monkeypatch.setattr(homework.time, 'sleep', mock_sleep)
+        monkeypatch.setattr(homework.SESSION, 'get', mock_connection_error_get)
+
+        try:
+            homework.main()
+        except StopPolling:
+            pass
+
+        assert len(sleeps) == 2
+        assert len(sent) == 1, (
+            'Убедитесь, что повторяющаяся ошибка доступа к API '
+            'отправляется в Telegram только один раз'
+        )
+
+    def test_main_error_backoff(self, monkeypatch, random_timestamp):
+        class StopPolling(Exception):
+            pass
+
+        sleeps = []
+        outcomes = [False] * 7 + [True, False]
+
+        def mock_get(*args, **kwargs):
+            if not outcomes.pop(0):
+                raise requests.ConnectionError('Connection refused')
+            return MockResponseGET(
+                *args, random_timestamp=random_timestamp,
+                current_timestamp=kwargs['params']['from_date'], **kwargs
+            )
+
+        def mock_sleep(interval):
+            sleeps.append(interval)
+            if not outcomes:
+                raise StopPolling
+
+        def mock_sleep_from(started_ns, interval):
+            mock_sleep(interval)
+
+        import homework
+
+        monkeypatch.setattr(homework, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', '12345')
+        monkeypatch.setattr(homework, 'Bot', MockTelegramBot)
+        monkeypatch.setattr(homework.time, 'sleep', mock_sleep)
+        monkeypatch.setattr(homework, 'sleep_from', mock_sleep_from)
+        monkeypatch.setattr(homework.SESSION, 'get', mock_get)
+
+        try:
+            homework.main()
+        except StopPolling:
+            pass
+
+        retry_time = homework.RETRY_TIME
+        assert sleeps == [
+            10, 20, 40, 80, 160, 320, retry_time, retry_time, 10
+        ], (
+            'Убедитесь, что после ошибок пауза растёт экспоненциально, '
+            'не превышает RETRY_TIME и сбрасывается после успешного запроса'
+        )
+
+    def test_main_adaptive_polling(self, monkeypatch):
+        class StopPolling(BaseException):
+            pass
+
+        sent = []
+        from_dates = []
+        sleeps = []
+        homework_item = {'homework_name': 'hw123', 'status': 'approved'}
+        payloads = [
+            ([], 101), ([], 102), ([], 103), ([], 104), ([], None),
+            ([homework_item], 106), ([], 107),
+        ]
+
+        class RecordingBot(MockTelegramBot):
+            def send_message(self, chat_id=None, text=None, **kwargs):
+                sent.append(text)
+                return super().send_message(chat_id, text, **kwargs)
+
+        def mock_get(*args, **kwargs):
+            from_date = kwargs['params']['from_date']
+            from_dates.append(from_date)
+            homeworks, current_date = payloads.pop(0)
+            response = MockResponseGET(
+                *args, current_timestamp=from_date, **kwargs)
+            response.json = lambda: {
+                'homeworks': homeworks, 'current_date': current_date}
+            return response
+
+        def mock_sleep_from(started_ns, interval):
+            sleeps.append(interval)
+            if not payloads:
+                raise StopPolling
+
+        import homework
+
+        monkeypatch.setattr(homework, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', '12345')
+        monkeypatch.setattr(homework, 'Bot', RecordingBot)
+        monkeypatch.setattr(homework, 'sleep_from', mock_sleep_from)
+        monkeypatch.setattr(homework.SESSION, 'get', mock_get)
+
+        try:
+            homework.main()
+        except StopPolling:
+            pass
+
+        assert from_dates[1:] == [101, 102, 103, 104, 104, 106], (
+            'Убедитесь, что следующий запрос использует `current_date` '
+            'из ответа API и не теряет его при пустом значении'
+        )
+        assert sleeps == [600, 1200, 2400, 3600, 3600, 600, 600], (
+            'Убедитесь, что без изменений пауза удваивается до '
+            'MAX_RETRY_TIME и сбрасывается при новых статусах'
+        )
+        assert len(sent) == 1